@@ -0,0 +1,187 @@
+"""
+NumPy views over packed SafeStruct records.
+
+NumPy is an optional dependency: it is imported on first use, so the rest of
+safestruct works without it.
+"""
+
+from typing import Any, Type
+
+from safestruct.descriptors import BytesField, TextField
+from safestruct.enums import FieldKind
+from safestruct.exceptions import FormatError, UnpackingError
+
+_NUMPY_TYPES = {
+    "b": "i1",
+    "B": "u1",
+    "h": "i2",
+    "H": "u2",
+    "i": "i4",
+    "I": "u4",
+    "l": "i4",
+    "L": "u4",
+    "q": "i8",
+    "Q": "u8",
+    "f": "f4",
+    "d": "f8",
+    "?": "?",
+}
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Columnar unpacking requires NumPy. Install it with 'pip install safestruct[numpy]'."
+        ) from e
+
+    return numpy
+
+
+def _field_dtype(descriptor: Any, endian: str, decoded: bool = False) -> Any:
+    """
+    Maps a primitive or bytes descriptor onto a NumPy dtype description.
+    BytesField uses the raw 'V' dtype, which keeps trailing nulls; TextField
+    uses 'S', or 'U' when describing decoded columns.
+    """
+
+    if isinstance(descriptor, TextField):
+        return f"{'U' if decoded else 'S'}{descriptor._length}"
+
+    if isinstance(descriptor, BytesField):
+        return f"V{descriptor._length}"
+
+    struct_char = descriptor.get_struct_char().lstrip("@=<>!")
+    if struct_char not in _NUMPY_TYPES:
+        raise FormatError(
+            f"'{descriptor.get_struct_char()}' has no NumPy equivalent for columnar unpacking."
+        )
+
+    return f"{endian}{_NUMPY_TYPES[struct_char]}"
+
+
+def _dtype_fields(cls: Type, endian: str, decoded: bool = False) -> list:
+    dtype_fields = []
+
+    for entry in cls._safestruct_plan:
+        if entry.kind == FieldKind.SUBSTRUCT:
+            dtype_fields.append(
+                (entry.name, _dtype_fields(entry.struct_class, endian, decoded))
+            )
+        elif entry.kind == FieldKind.ARRAY:
+            item_dtype = _field_dtype(entry.descriptor._item_descriptor, endian)
+            dtype_fields.append((entry.name, item_dtype, (entry.num_primitives,)))
+        else:
+            dtype_fields.append(
+                (entry.name, _field_dtype(entry.descriptor, endian, decoded))
+            )
+
+    return dtype_fields
+
+
+def _endian(cls: Type) -> str:
+    return "<" if cls._safestruct_format[0] == "<" else ">"
+
+
+def numpy_dtype(cls: Type) -> Any:
+    """
+    Returns the NumPy structured dtype with the same memory layout as a
+    SafeStruct class. Byte order is marked on every field, so NumPy swaps
+    lazily on access instead of rewriting the buffer.
+    """
+
+    dtype = cls.__dict__.get("_safestruct_numpy_dtype")
+
+    if dtype is None:
+        numpy = _import_numpy()
+        dtype = numpy.dtype(_dtype_fields(cls, _endian(cls)))
+        cls._safestruct_numpy_dtype = dtype
+
+    return dtype
+
+
+def unpack_array(cls: Type, buffer: bytes) -> Any:
+    """
+    Views back-to-back records as a structured ndarray using the class's
+    NumPy dtype. No data is copied, so the array is read-only for immutable
+    buffers and shares memory with mutable ones.
+    """
+
+    numpy = _import_numpy()
+
+    try:
+        return numpy.frombuffer(buffer, dtype=numpy_dtype(cls))
+    except ValueError as e:
+        raise UnpackingError(
+            f"Array unpacking failed for {cls.__name__} (Format: {cls._safestruct_format}): {e}"
+        )
+
+
+def wrap(cls: Type, array: Any, index: int) -> Any:
+    """
+    Builds a single instance from one record of an array returned by
+    unpack_array(), decoding it the same way unpack() does.
+    """
+
+    if getattr(array, "dtype", None) != numpy_dtype(cls):
+        raise UnpackingError(
+            f"Cannot wrap record for {cls.__name__}: array dtype does not match its layout."
+        )
+
+    return cls.unpack(array[index].tobytes())
+
+
+def _decode_text(numpy: Any, cls: Type, source: Any, target: Any) -> None:
+    """Copies nested struct records into ``target``, decoding text fields on the way."""
+
+    for entry in cls._safestruct_plan:
+        if entry.kind == FieldKind.SUBSTRUCT:
+            _decode_text(
+                numpy, entry.struct_class, source[entry.name], target[entry.name]
+            )
+        elif isinstance(entry.descriptor, TextField):
+            target[entry.name] = numpy.char.decode(
+                source[entry.name], entry.descriptor._encoding
+            )
+        else:
+            target[entry.name] = source[entry.name]
+
+
+def unpack_columns(cls: Type, buffer: bytes) -> dict:
+    """
+    Unpacks back-to-back records into a structure of arrays: one contiguous
+    ndarray per field. TextField columns, including those inside nested
+    structs, are decoded to NumPy unicode arrays; BytesField columns use the
+    raw 'V' dtype, so trailing nulls are kept.
+    """
+
+    numpy = _import_numpy()
+
+    try:
+        records = numpy.frombuffer(buffer, dtype=numpy_dtype(cls))
+    except ValueError as e:
+        raise UnpackingError(
+            f"Columnar unpacking failed for {cls.__name__} (Format: {cls._safestruct_format}): {e}"
+        )
+
+    columns = {}
+
+    for entry in cls._safestruct_plan:
+        column = records[entry.name]
+
+        if entry.kind == FieldKind.SUBSTRUCT:
+            decoded = numpy.empty(
+                len(records),
+                dtype=_dtype_fields(entry.struct_class, _endian(cls), decoded=True),
+            )
+            _decode_text(numpy, entry.struct_class, column, decoded)
+            column = decoded
+        elif isinstance(entry.descriptor, TextField):
+            column = numpy.char.decode(column, entry.descriptor._encoding)
+        else:
+            column = column.copy()
+
+        columns[entry.name] = column
+
+    return columns
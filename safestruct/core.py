@@ -1,9 +1,19 @@
 import struct as stdlib_struct
 from dataclasses import dataclass, fields
-from typing import Type, Tuple, Any, List
-
-from safestruct.enums import ByteOrder
-from safestruct.descriptors import FieldDescriptor, SubStructField, ArrayField
+from typing import Any, Callable, Type, Tuple, List, NamedTuple, Optional
+
+from safestruct import columnar
+from safestruct.enums import ByteOrder, FieldKind
+from safestruct.descriptors import (
+    FieldDescriptor,
+    IntField,
+    BooleanField,
+    FloatField,
+    SubStructField,
+    ArrayField,
+    BytesField,
+    TextField,
+)
 from safestruct.exceptions import (
     ValidationError,
     PackingError,
@@ -12,6 +22,20 @@ from safestruct.exceptions import (
 )
 
 
+_STRUCT_CACHE: dict = {}
+
+
+def _get_compiled_struct(format_string: str) -> stdlib_struct.Struct:
+    """Returns the shared ``struct.Struct`` for a format, compiling it on first use."""
+
+    compiled = _STRUCT_CACHE.get(format_string)
+
+    if compiled is None:
+        compiled = _STRUCT_CACHE[format_string] = stdlib_struct.Struct(format_string)
+
+    return compiled
+
+
 def _compile_format_string(cls: Type, order: ByteOrder) -> Tuple[str, dict]:
     """Compiles the final struct format string from dataclass fields."""
 
@@ -31,215 +55,744 @@ def _compile_format_string(cls: Type, order: ByteOrder) -> Tuple[str, dict]:
         format_parts.append(struct_char)
 
         if isinstance(descriptor, SubStructField):
-            num_primitives = len(struct_char)
+            kind = FieldKind.SUBSTRUCT
+            num_primitives = sum(
+                entry.num_primitives
+                for entry in descriptor._struct_class._safestruct_plan
+            )
         elif isinstance(descriptor, ArrayField):
+            kind = FieldKind.ARRAY
             num_primitives = descriptor.get_primitive_count()
+        elif hasattr(descriptor, "pack_value") or hasattr(descriptor, "unpack_value"):
+            kind = FieldKind.ENCODED
+            num_primitives = 1
         else:
+            kind = FieldKind.PRIMITIVE
             num_primitives = 1
 
         field_metadata[field.name] = {
             "char": struct_char,
             "validator": descriptor.get_validator(),
             "descriptor": descriptor,
+            "kind": kind,
             "num_primitives": num_primitives,
         }
 
     return "".join(format_parts), field_metadata
 
 
-def _flatten_values(instance: Any, cls: Type) -> List[Any]:
-    values = []
+class _FieldPlan(NamedTuple):
+    """One field of a compiled struct, with every per-field decision resolved."""
 
-    for field_name, field_info in cls._safestruct_field_map.items():
-        value = getattr(instance, field_name)
-        descriptor = field_info["descriptor"]
+    name: str
+    kind: FieldKind
+    num_primitives: int
+    validator: Callable
+    pack_value: Optional[Callable]
+    unpack_value: Optional[Callable]
+    struct_class: Optional[Type]
+    descriptor: FieldDescriptor
 
-        if not field_info["validator"](value):
-            raise ValidationError(
-                f"Validation failed for field '{field_name}' in {cls.__name__}. Value: {value}"
-            )
 
-        if isinstance(descriptor, SubStructField):
-            packed_sub_bytes = value.pack()
+def _build_plan(field_map: dict) -> Tuple[_FieldPlan, ...]:
+    """
+    Freezes the field map into a tuple of plan entries, with ``None`` for the
+    hooks a field does not have.
+    """
+
+    plan = []
 
-            sub_values = stdlib_struct.unpack(
-                descriptor._struct_class._safestruct_format, packed_sub_bytes
+    for field_name, field_info in field_map.items():
+        descriptor = field_info["descriptor"]
+        plan.append(
+            _FieldPlan(
+                field_name,
+                field_info["kind"],
+                field_info["num_primitives"],
+                field_info["validator"],
+                getattr(descriptor, "pack_value", None),
+                getattr(descriptor, "unpack_value", None),
+                getattr(descriptor, "_struct_class", None),
+                descriptor,
             )
-            values.extend(sub_values)
+        )
+
+    return tuple(plan)
+
+
+def _compile_field_layout(cls: Type) -> Tuple[dict, dict]:
+    """
+    Computes each field's byte offset inside the struct and a compiled
+    ``struct.Struct`` covering just that field.
+    """
+
+    prefix = cls._safestruct_format[0]
+    offsets = {}
+    field_structs = {}
+    offset = 0
+
+    for field_name, field_info in cls._safestruct_field_map.items():
+        field_struct = _get_compiled_struct(prefix + field_info["char"])
+        offsets[field_name] = offset
+        field_structs[field_name] = field_struct
+        offset += field_struct.size
+
+    return offsets, field_structs
+
+
+def _compile_function(name: str, source: str, namespace: dict) -> Callable:
+    """
+    Compiles generated function source and returns the function it defines.
+
+    The source is wrapped in a factory taking every ``namespace`` entry as a
+    parameter, so the generated function reads them as closure cells instead
+    of probing a globals dict on each call.
+    """
+
+    factory_source = (
+        f"def __create_fn__({', '.join(namespace)}):\n"
+        f"{_indent(source.splitlines())}"
+        f"    return {name}\n"
+    )
+    scope: dict = {}
+    exec(factory_source, {}, scope)  # nosec B102 - source is built from field metadata only
+    return scope["__create_fn__"](**namespace)
+
+
+def _base_namespace(cls: Type) -> dict:
+    return {
+        "_compiled": cls._safestruct_compiled,
+        "_cls_name": cls.__name__,
+        "_format": cls._safestruct_format,
+        "_struct_error": stdlib_struct.error,
+        "ValidationError": ValidationError,
+        "PackingError": PackingError,
+        "UnpackingError": UnpackingError,
+        "isinstance": isinstance,
+        "len": len,
+        "int": int,
+        "float": float,
+        "list": list,
+        "bytearray": bytearray,
+        "bytes": bytes,
+    }
+
+
+def _inline_condition(
+    descriptor: FieldDescriptor, var: str, check: str, namespace: dict
+) -> Optional[str]:
+    """
+    Inlines a primitive field's type check, with literal bounds or length, as
+    a single expression. Returns ``None`` for fields that cannot be inlined,
+    including subclasses that override ``get_validator()``.
+    """
+
+    validator_impl = type(descriptor).get_validator
+
+    if validator_impl is IntField.get_validator:
+        condition = (
+            f"isinstance({var}, int) and "
+            f"{descriptor._min_val} <= {var} <= {descriptor._max_val}"
+        )
+    elif validator_impl is BooleanField.get_validator:
+        condition = f"({var} is True or {var} is False)"
+    elif validator_impl is FloatField.get_validator:
+        condition = f"isinstance({var}, float)"
+    elif validator_impl is BytesField.get_validator:
+        condition = (
+            f"isinstance({var}, (bytes, bytearray)) and "
+            f"len({var}) == {descriptor._length}"
+        )
+    else:
+        return None
 
-        elif hasattr(descriptor, "pack_value"):
-            packed_sub_value = descriptor.pack_value(value)
+    if descriptor.has_custom_check():
+        namespace[check] = descriptor._validator
+        condition += f" and {check}({var})"
 
-            if isinstance(descriptor, ArrayField):
-                values.extend(packed_sub_value)
-            else:
-                values.append(packed_sub_value)
+    return condition
 
+
+def _build_validation(
+    entry: _FieldPlan, var: str, key: str, error: str, namespace: dict
+) -> List[str]:
+    """
+    Builds the statements that validate ``var`` and run ``error`` on failure.
+
+    Primitive checks, including array items, are inlined so no validator
+    call is made; other fields call their compiled validator, and fields
+    without any check emit nothing.
+    """
+
+    descriptor = entry.descriptor
+    condition = _inline_condition(descriptor, var, f"_check{key}", namespace)
+
+    if condition is not None:
+        return [f"if not ({condition}):", f"    {error}"]
+
+    if type(descriptor).get_validator is ArrayField.get_validator:
+        item_condition = _inline_condition(
+            descriptor._item_descriptor, "element", f"_item_check{key}", namespace
+        )
+
+        if item_condition is not None:
+            return [
+                f"if not (isinstance({var}, list) and len({var}) == {entry.num_primitives}):",
+                f"    {error}",
+                f"for element in {var}:",
+                f"    if not ({item_condition}):",
+                f"        {error}",
+            ]
+
+    if (
+        type(descriptor).get_validator is FieldDescriptor.get_validator
+        and not descriptor.has_custom_check()
+    ):
+        return []
+
+    namespace[f"_check{key}"] = entry.validator
+    return [f"if not _check{key}({var}):", f"    {error}"]
+
+
+def _build_pack_expression(
+    entry: _FieldPlan, var: str, key: str, namespace: dict
+) -> str:
+    """
+    Builds the struct argument for an encoded field. The built-in bytes and
+    text conversions are inlined; custom descriptors call their pack_value,
+    and so does text whose validator is overridden, so its length check runs.
+    """
+
+    descriptor = entry.descriptor
+    descriptor_type = type(descriptor)
+
+    if descriptor_type.pack_value is BytesField.pack_value:
+        return var
+
+    if (
+        descriptor_type.pack_value is TextField.pack_value
+        and descriptor_type.get_validator is TextField.get_validator
+    ):
+        # The stock validator has already rejected strings that encode too
+        # long, and struct null-pads short 's' values itself.
+        return f"{var}.encode({descriptor._encoding!r})"
+
+    namespace[f"_pack_value{key}"] = entry.pack_value
+    return f"_pack_value{key}({var})"
+
+
+def _build_pack_body(
+    cls: Type, namespace: dict, owner: str = "self", prefix: str = ""
+) -> Tuple[List[str], List[str]]:
+    """
+    Builds the straight-line validation statements and the struct argument
+    expressions used by the generated pack methods.
+
+    Nested structs are inlined recursively: their fields are read and
+    validated in place so the outer struct is packed with a single call.
+    """
+
+    lines = []
+    arguments = []
+
+    for index, entry in enumerate(cls._safestruct_plan):
+        key = f"{prefix}{index}"
+        var = f"v{key}"
+
+        lines.append(f"{var} = {owner}.{entry.name}")
+        field_lines, field_arguments = _build_field_pack_body(
+            cls, entry, var, key, namespace
+        )
+        lines.extend(field_lines)
+        arguments.extend(field_arguments)
+
+    return lines, arguments
+
+
+def _build_field_pack_body(
+    cls: Type, entry: _FieldPlan, var: str, key: str, namespace: dict
+) -> Tuple[List[str], List[str]]:
+    """
+    Builds the validation statements and struct argument expressions for a
+    single field whose value is already bound to ``var``.
+    """
+
+    # Names are passed as values, never pasted into the generated source.
+    namespace[f"_error{key}"] = (
+        f"Validation failed for field '{entry.name}' in {cls.__name__}. Value: "
+    )
+    error = f'raise ValidationError(f"{{_error{key}}}{{{var}}}")'
+    lines = _build_validation(entry, var, key, error, namespace)
+
+    if entry.kind == FieldKind.SUBSTRUCT:
+        sub_lines, arguments = _build_pack_body(
+            entry.struct_class, namespace, owner=var, prefix=f"{key}_"
+        )
+        lines.extend(sub_lines)
+
+    elif entry.kind == FieldKind.ARRAY:
+        if type(entry.descriptor).pack_value is ArrayField.pack_value:
+            arguments = [f"{var}[{item}]" for item in range(entry.num_primitives)]
         else:
-            values.append(value)
+            namespace[f"_pack_value{key}"] = entry.pack_value
+            arguments = [f"*_pack_value{key}({var})"]
+
+    elif entry.kind == FieldKind.ENCODED and entry.pack_value is not None:
+        arguments = [_build_pack_expression(entry, var, key, namespace)]
+
+    else:
+        arguments = [var]
+
+    return lines, arguments
 
-    return values
+
+def _build_unpack_expression(
+    entry: _FieldPlan, key: str, cursor: int, namespace: dict
+) -> str:
+    """
+    Builds the expression that rebuilds one field from the flat ``values``
+    tuple, starting at position ``cursor``.
+    """
+
+    end = cursor + entry.num_primitives
+
+    if entry.kind == FieldKind.SUBSTRUCT:
+        namespace[f"_struct_class{key}"] = entry.struct_class
+        arguments = _build_unpack_arguments(
+            entry.struct_class, namespace, prefix=f"{key}_", cursor=cursor
+        )
+        return f"_struct_class{key}({', '.join(arguments)})"
+
+    if entry.kind == FieldKind.ARRAY:
+        if type(entry.descriptor).unpack_value is ArrayField.unpack_value:
+            items = ", ".join(f"values[{item}]" for item in range(cursor, end))
+            return f"[{items}]"
+
+        namespace[f"_unpack_value{key}"] = entry.unpack_value
+        return f"_unpack_value{key}(values[{cursor}:{end}])"
+
+    if entry.kind == FieldKind.ENCODED and entry.unpack_value is not None:
+        descriptor_type = type(entry.descriptor)
+
+        if descriptor_type.unpack_value is BytesField.unpack_value:
+            return f"values[{cursor}]"
+
+        if descriptor_type.unpack_value is TextField.unpack_value:
+            return (
+                f'values[{cursor}].partition(b"\\x00")[0]'
+                f".decode({entry.descriptor._encoding!r})"
+            )
+
+        namespace[f"_unpack_value{key}"] = entry.unpack_value
+        return f"_unpack_value{key}(values[{cursor}])"
+
+    return f"values[{cursor}]"
+
+
+def _build_unpack_arguments(
+    cls: Type, namespace: dict, prefix: str = "", cursor: int = 0
+) -> List[str]:
+    """
+    Builds the constructor argument expressions that rebuild each field from
+    the flat ``values`` tuple returned by the compiled struct.
+
+    Nested structs are rebuilt recursively from their own slice of ``values``,
+    so their bytes, text and array fields are decoded like top-level ones.
+    """
+
+    arguments = []
+
+    for index, entry in enumerate(cls._safestruct_plan):
+        arguments.append(
+            _build_unpack_expression(entry, f"{prefix}{index}", cursor, namespace)
+        )
+        cursor += entry.num_primitives
+
+    return arguments
+
+
+def _indent(lines: List[str], depth: int = 1) -> str:
+    padding = "    " * depth
+    return "".join(f"{padding}{line}\n" for line in lines)
 
 
 def _generate_pack_method(cls: Type):
     """Dynamically creates the .pack() instance method."""
 
-    def pack(self) -> bytes:
-        format_string = cls._safestruct_format
+    namespace = _base_namespace(cls)
+    lines, arguments = _build_pack_body(cls, namespace)
 
-        values = _flatten_values(self, cls)
+    source = (
+        "def pack(self):\n"
+        f"{_indent(lines)}"
+        "    try:\n"
+        f"        return _compiled.pack({', '.join(arguments)})\n"
+        "    except _struct_error as e:\n"
+        "        raise PackingError(\n"
+        f'            f"Packing struct failed for {{_cls_name}} '
+        f'(Format: {{_format}}): {{e}}"\n'
+        "        )\n"
+    )
 
-        try:
-            return stdlib_struct.pack(format_string, *values)
-        except stdlib_struct.error as e:
-            raise PackingError(
-                f"Packing struct failed for {cls.__name__} (Format: {format_string}): {e}"
-            )
+    return _compile_function("pack", source, namespace)
+
+
+def _generate_validate_method(cls: Type):
+    """
+    Dynamically creates the private ._validate() instance method, which runs
+    the same inlined checks as .pack() without packing.
+    """
 
-    return pack
+    namespace = _base_namespace(cls)
+    lines, _ = _build_pack_body(cls, namespace)
+
+    source = f"def _validate(self):\n{_indent(lines)}    return None\n"
+
+    return _compile_function("_validate", source, namespace)
 
 
 def _generate_pack_into_method(cls: Type):
     """Dynamically creates the .pack_into(buffer, offset) instance method."""
 
-    def pack_into(self, buffer: bytearray, offset: int = 0):
-        format_string = cls._safestruct_format
-
-        values = _flatten_values(self, cls)
+    namespace = _base_namespace(cls)
+    lines, arguments = _build_pack_body(cls, namespace)
 
-        try:
-            stdlib_struct.pack_into(format_string, buffer, offset, *values)
-        except stdlib_struct.error as e:
-            raise PackingError(
-                f"Pack into buffer failed for {cls.__name__} (Format: {format_string}): {e}"
-            )
+    source = (
+        "def pack_into(self, buffer, offset=0):\n"
+        f"{_indent(lines)}"
+        "    try:\n"
+        f"        _compiled.pack_into(buffer, offset, {', '.join(arguments)})\n"
+        "    except _struct_error as e:\n"
+        "        raise PackingError(\n"
+        f'            f"Pack into buffer failed for {{_cls_name}} '
+        f'(Format: {{_format}}): {{e}}"\n'
+        "        )\n"
+    )
 
-    return pack_into
+    return _compile_function("pack_into", source, namespace)
 
 
 def _generate_unpack_method(cls: Type):
     """Dynamically creates the .unpack() class method."""
 
-    @classmethod
-    def unpack(cls, buffer: bytes):
-        format_string = cls._safestruct_format
+    namespace = _base_namespace(cls)
+    arguments = _build_unpack_arguments(cls, namespace)
+
+    source = (
+        "def unpack(cls, buffer):\n"
+        "    try:\n"
+        "        values = _compiled.unpack(buffer)\n"
+        "    except _struct_error as e:\n"
+        f"        if len(buffer) < {cls._safestruct_size}:\n"
+        "            raise UnpackingError(\n"
+        f'                f"Unpack buffer too small for {{_cls_name}}. '
+        f'Expected {cls._safestruct_size} bytes, got {{len(buffer)}}."\n'
+        "            )\n"
+        "        raise UnpackingError(\n"
+        f'            f"Unpacking struct failed for {{_cls_name}} '
+        f'(Format: {{_format}}): {{e}}"\n'
+        "        )\n"
+        f"    return cls({', '.join(arguments)})\n"
+    )
+
+    return classmethod(_compile_function("unpack", source, namespace))
 
-        expected_size = cls._safestruct_size
-        if len(buffer) < expected_size:
-            raise UnpackingError(
-                f"Unpack buffer too small for {cls.__name__}. Expected {expected_size} bytes, got {len(buffer)}."
-            )
 
-        try:
-            unpacked_values = stdlib_struct.unpack(format_string, buffer)
-        except stdlib_struct.error as e:
-            raise UnpackingError(
-                f"Unpacking struct failed for {cls.__name__} (Format: {format_string}): {e}"
-            )
+def _generate_unpack_from_method(cls: Type):
+    """Dynamically creates the .unpack_from(buffer, offset) class method."""
 
-        instance_args = []
-        value_cursor = 0
+    namespace = _base_namespace(cls)
+    arguments = _build_unpack_arguments(cls, namespace)
 
-        for field_name, field_info in cls._safestruct_field_map.items():
-            descriptor = field_info["descriptor"]
-            num_primitives = field_info["num_primitives"]
+    source = (
+        "def unpack_from(cls, buffer, offset=0):\n"
+        "    try:\n"
+        "        values = _compiled.unpack_from(buffer, offset)\n"
+        "    except _struct_error as e:\n"
+        f"        if len(buffer) < offset + {cls._safestruct_size}:\n"
+        "            raise UnpackingError(\n"
+        f'                f"Unpack buffer too small for {{_cls_name}}. '
+        f'Expected {cls._safestruct_size} bytes starting "\n'
+        '                f"at offset {offset}, but buffer ends at index {len(buffer)}."\n'
+        "            )\n"
+        "        raise UnpackingError(\n"
+        f'            f"Unpacking from buffer failed for {{_cls_name}} '
+        f'(Format: {{_format}}): {{e}}"\n'
+        "        )\n"
+        f"    return cls({', '.join(arguments)})\n"
+    )
 
-            primitive_slice = unpacked_values[
-                value_cursor : value_cursor + num_primitives
-            ]
-            value_cursor += num_primitives
+    return classmethod(_compile_function("unpack_from", source, namespace))
 
-            if isinstance(descriptor, SubStructField):
-                nested_instance = descriptor._struct_class(*primitive_slice)
-                instance_args.append(nested_instance)
 
-            elif isinstance(descriptor, ArrayField):
-                instance_args.append(descriptor.unpack_value(primitive_slice))
+def _field_entry(cls: Type, name: str) -> Optional[_FieldPlan]:
+    for entry in cls._safestruct_plan:
+        if entry.name == name:
+            return entry
 
-            elif hasattr(descriptor, "unpack_value"):
-                if not primitive_slice:
-                    raise UnpackingError(
-                        f"Corrupted data for field '{field_name}' during unpack."
-                    )
+    return None
 
-                raw_bytes = primitive_slice[0]
-                instance_args.append(descriptor.unpack_value(raw_bytes))
 
-            else:
-                if not primitive_slice:
-                    raise UnpackingError(
-                        f"Corrupted data for field '{field_name}' during unpack."
-                    )
+def _generate_field_unpacker(cls: Type, entry: _FieldPlan) -> Callable:
+    """
+    Generates the ``(buffer, offset)`` decoder for one field, which reads only
+    that field's bytes with its own compiled struct.
+    """
 
-                instance_args.append(primitive_slice[0])
+    field_name = entry.name
+    namespace = _base_namespace(cls)
+    namespace["_compiled"] = cls._safestruct_field_structs[field_name]
+    namespace["_field_name"] = field_name
+    expression = _build_unpack_expression(entry, "", 0, namespace)
+    field_offset = cls._safestruct_field_offsets[field_name]
+
+    source = (
+        "def unpack_field(buffer, offset=0):\n"
+        "    try:\n"
+        f"        values = _compiled.unpack_from(buffer, offset + {field_offset})\n"
+        "    except _struct_error as e:\n"
+        "        raise UnpackingError(\n"
+        f"            f\"Unpacking field '{{_field_name}}' failed for {{_cls_name}} "
+        f'(Format: {{_format}}): {{e}}"\n'
+        "        )\n"
+        f"    return {expression}\n"
+    )
+
+    return _compile_function("unpack_field", source, namespace)
+
+
+def _generate_field_packer(cls: Type, entry: _FieldPlan) -> Callable:
+    """
+    Generates the ``(buffer, value, offset)`` encoder for one field, which
+    validates the value and writes only that field's bytes with its own
+    compiled struct.
+    """
 
-        return cls(*instance_args)
+    field_name = entry.name
+    namespace = _base_namespace(cls)
+    namespace["_compiled"] = cls._safestruct_field_structs[field_name]
+    namespace["_field_name"] = field_name
+    lines, arguments = _build_field_pack_body(cls, entry, "value", "", namespace)
+    field_offset = cls._safestruct_field_offsets[field_name]
 
-    return unpack
+    source = (
+        "def pack_field_into(buffer, value, offset=0):\n"
+        f"{_indent(lines)}"
+        "    try:\n"
+        f"        _compiled.pack_into(buffer, offset + {field_offset}, "
+        f"{', '.join(arguments)})\n"
+        "    except _struct_error as e:\n"
+        "        raise PackingError(\n"
+        f"            f\"Packing field '{{_field_name}}' failed for {{_cls_name}} "
+        f'(Format: {{_format}}): {{e}}"\n'
+        "        )\n"
+    )
 
+    return _compile_function("pack_field_into", source, namespace)
 
-def _generate_unpack_from_method(cls: Type):
-    """Dynamically creates the .unpack_from(buffer, offset) class method."""
+
+def _generate_pack_field_into_method(cls: Type):
+    """Creates the .pack_field_into(buffer, name, value, offset) class method."""
 
     @classmethod
-    def unpack_from(cls, buffer: bytes, offset: int = 0):
-        format_string = cls._safestruct_format
+    def pack_field_into(cls, buffer, name: str, value, offset: int = 0):
+        try:
+            packer = cls._safestruct_field_packers[name]
+        except KeyError:
+            # Generated on first use, like the unpack_field() decoders.
+            entry = _field_entry(cls, name)
+            if entry is None:
+                raise PackingError(f"'{name}' is not a field of {cls.__name__}.")
 
-        expected_size = cls._safestruct_size
+            packer = _generate_field_packer(cls, entry)
+            cls._safestruct_field_packers[name] = packer
 
-        if len(buffer) < offset + expected_size:
-            raise UnpackingError(
-                f"Unpack buffer too small for {cls.__name__}. Expected {expected_size} bytes starting "
-                f"at offset {offset}, but buffer ends at index {len(buffer)}."
-            )
+        packer(buffer, value, offset)
 
+    return pack_field_into
+
+
+def _generate_unpack_field_method(cls: Type):
+    """Creates the .unpack_field(buffer, name, offset) class method."""
+
+    @classmethod
+    def unpack_field(cls, buffer: bytes, name: str, offset: int = 0):
         try:
-            unpacked_values = stdlib_struct.unpack_from(format_string, buffer, offset)
-        except stdlib_struct.error as e:
-            raise UnpackingError(
-                f"Unpacking from buffer failed for {cls.__name__} (Format: {format_string}): {e}"
-            )
+            unpacker = cls._safestruct_field_unpackers[name]
+        except KeyError:
+            # Decoders are generated on first use, so decorating a class does
+            # not pay for fields that are never read on their own.
+            entry = _field_entry(cls, name)
+            if entry is None:
+                raise UnpackingError(f"'{name}' is not a field of {cls.__name__}.")
+
+            unpacker = _generate_field_unpacker(cls, entry)
+            cls._safestruct_field_unpackers[name] = unpacker
+
+        return unpacker(buffer, offset)
+
+    return unpack_field
+
+
+def _generate_pack_many_method(cls: Type):
+    """Dynamically creates the .pack_many(items) class method."""
+
+    namespace = _base_namespace(cls)
+    lines, arguments = _build_pack_body(cls, namespace, owner="record")
+    size = cls._safestruct_size
+
+    source = (
+        "def pack_many(cls, items):\n"
+        f"    buffer = bytearray({size} * len(items))\n"
+        "    offset = 0\n"
+        "    for record in items:\n"
+        f"{_indent(lines, depth=2)}"
+        "        try:\n"
+        f"            _compiled.pack_into(buffer, offset, {', '.join(arguments)})\n"
+        "        except _struct_error as e:\n"
+        "            raise PackingError(\n"
+        f'                f"Packing many failed for {{_cls_name}} at offset {{offset}} '
+        f'(Format: {{_format}}): {{e}}"\n'
+        "            )\n"
+        f"        offset += {size}\n"
+        "    return bytes(buffer)\n"
+    )
+
+    return classmethod(_compile_function("pack_many", source, namespace))
+
+
+def _generate_unpack_many_method(cls: Type):
+    """Dynamically creates the .unpack_many(buffer) class method."""
+
+    namespace = _base_namespace(cls)
+    arguments = _build_unpack_arguments(cls, namespace)
+
+    source = (
+        "def unpack_many(cls, buffer):\n"
+        "    try:\n"
+        "        records = _compiled.iter_unpack(buffer)\n"
+        "    except _struct_error as e:\n"
+        "        raise UnpackingError(\n"
+        f'            f"Unpacking many failed for {{_cls_name}} '
+        f'(Format: {{_format}}): {{e}}"\n'
+        "        )\n"
+        f"    return [cls({', '.join(arguments)}) for values in records]\n"
+    )
+
+    return classmethod(_compile_function("unpack_many", source, namespace))
+
+
+def _generate_iter_unpack_method(cls: Type):
+    """
+    Dynamically creates the .iter_unpack(buffer) class method, a lazy
+    counterpart to .unpack_many() that builds one instance per iteration.
+    """
 
-        instance_args = []
-        value_cursor = 0
+    namespace = _base_namespace(cls)
+    arguments = _build_unpack_arguments(cls, namespace)
 
-        for field_name, field_info in cls._safestruct_field_map.items():
-            descriptor = field_info["descriptor"]
-            num_primitives = field_info["num_primitives"]
+    source = (
+        "def iter_unpack(cls, buffer):\n"
+        "    try:\n"
+        "        records = _compiled.iter_unpack(buffer)\n"
+        "    except _struct_error as e:\n"
+        "        raise UnpackingError(\n"
+        f'            f"Iterative unpacking failed for {{_cls_name}} '
+        f'(Format: {{_format}}): {{e}}"\n'
+        "        )\n"
+        f"    return (cls({', '.join(arguments)}) for values in records)\n"
+    )
 
-            primitive_slice = unpacked_values[
-                value_cursor : value_cursor + num_primitives
-            ]
-            value_cursor += num_primitives
+    return classmethod(_compile_function("iter_unpack", source, namespace))
 
-            if not primitive_slice and num_primitives > 0:
-                raise UnpackingError(
-                    f"Corrupted data or unexpected end of buffer for field '{field_name}'."
-                )
 
-            if isinstance(descriptor, SubStructField):
-                nested_instance = descriptor._struct_class(*primitive_slice)
-                instance_args.append(nested_instance)
+def _add_slots(cls: Type) -> Type:
+    """
+    Recreates a dataclass with ``__slots__`` for its fields, the same way
+    ``dataclass(slots=True)`` does, so it can be applied after ``@dataclass``.
+    ``__class__`` cells are pointed at the new class so zero-argument
+    ``super()`` keeps working, and frozen classes get pickling support.
+    """
 
-            elif isinstance(descriptor, ArrayField):
-                instance_args.append(descriptor.unpack_value(primitive_slice))
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already specifies __slots__")
 
-            elif hasattr(descriptor, "unpack_value"):
-                raw_bytes = primitive_slice[0]
-                instance_args.append(descriptor.unpack_value(raw_bytes))
+    inherited_slots = {
+        name for base in cls.__mro__[1:-1] for name in _declared_slots(base)
+    }
+    field_names = tuple(
+        field.name for field in fields(cls) if field.name not in inherited_slots
+    )
 
-            else:
-                instance_args.append(primitive_slice[0])
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for field_name in field_names:
+        cls_dict.pop(field_name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
 
-        return cls(*instance_args)
+    if cls.__dataclass_params__.frozen:
+        cls_dict.setdefault("__getstate__", _frozen_getstate)
+        cls_dict.setdefault("__setstate__", _frozen_setstate)
 
-    return unpack_from
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
 
+    for value in cls_dict.values():
+        _update_class_cell(value, cls, slotted_cls)
 
-def struct(order: ByteOrder):
+    return slotted_cls
+
+
+def _declared_slots(cls: Type) -> Tuple[str, ...]:
+    """Returns the slot names a class declares itself, treating a string as one name."""
+
+    slots = cls.__dict__.get("__slots__", ())
+
+    if isinstance(slots, str):
+        return (slots,)
+
+    return tuple(slots)
+
+
+def _frozen_getstate(self):
+    return [getattr(self, field.name) for field in fields(self)]
+
+
+def _frozen_setstate(self, state):
+    for field, value in zip(fields(self), state):
+        object.__setattr__(self, field.name, value)
+
+
+def _update_class_cell(value: Any, old_cls: Type, new_cls: Type) -> None:
+    """
+    Repoints the ``__class__`` closure cell of a method defined in the original
+    class body, which zero-argument ``super()`` reads.
+    """
+
+    if isinstance(value, (classmethod, staticmethod)):
+        value = value.__func__
+    if isinstance(value, property):
+        for accessor in (value.fget, value.fset, value.fdel):
+            _update_class_cell(accessor, old_cls, new_cls)
+        return
+
+    code = getattr(value, "__code__", None)
+    if code is None or "__class__" not in code.co_freevars:
+        return
+
+    cell = value.__closure__[code.co_freevars.index("__class__")]
+    if cell.cell_contents is old_cls:
+        cell.cell_contents = new_cls
+
+
+def struct(order: ByteOrder, *, slots: bool = False):
     """
     Decorator that transforms a dataclass into a SafeStruct definition.
     Requires explicit byte ordering (LITTLE, BIG, or NETWORK).
+
+    With ``slots=True`` the class is rebuilt with ``__slots__`` for its fields,
+    which drops the per-instance ``__dict__`` and speeds up field access.
     """
 
     if order in (ByteOrder.NATIVE, ByteOrder.STANDARD):
@@ -252,21 +805,42 @@ def struct(order: ByteOrder):
         if not hasattr(cls, "__dataclass_fields__"):
             cls = dataclass(cls)
 
+        if slots:
+            cls = _add_slots(cls)
+
         final_order = order
 
         format_string, field_map = _compile_format_string(cls, final_order)
 
         cls._safestruct_format = format_string
         cls._safestruct_field_map = field_map
-        cls._safestruct_size = stdlib_struct.calcsize(format_string)
+        cls._safestruct_plan = _build_plan(field_map)
+        cls._safestruct_compiled = _get_compiled_struct(format_string)
+        cls._safestruct_size = compiled_size = cls._safestruct_compiled.size
+        cls._safestruct_slots = slots
+        (
+            cls._safestruct_field_offsets,
+            cls._safestruct_field_structs,
+        ) = _compile_field_layout(cls)
+        cls._safestruct_field_unpackers = {}
+        cls._safestruct_field_packers = {}
 
         setattr(cls, "pack", _generate_pack_method(cls))
+        setattr(cls, "_validate", _generate_validate_method(cls))
         setattr(cls, "unpack", _generate_unpack_method(cls))
-        setattr(cls, "format_string", property(lambda self: cls._safestruct_format))
-        setattr(cls, "size", property(lambda self: cls._safestruct_size))
-        setattr(cls, "field_info", property(lambda self: cls._safestruct_field_map))
+        setattr(cls, "format_string", property(lambda self: format_string))
+        setattr(cls, "size", property(lambda self: compiled_size))
+        setattr(cls, "field_info", property(lambda self: field_map))
         setattr(cls, "pack_into", _generate_pack_into_method(cls))
         setattr(cls, "unpack_from", _generate_unpack_from_method(cls))
+        setattr(cls, "unpack_field", _generate_unpack_field_method(cls))
+        setattr(cls, "pack_field_into", _generate_pack_field_into_method(cls))
+        setattr(cls, "pack_many", _generate_pack_many_method(cls))
+        setattr(cls, "unpack_many", _generate_unpack_many_method(cls))
+        setattr(cls, "iter_unpack", _generate_iter_unpack_method(cls))
+        setattr(cls, "unpack_columns", classmethod(columnar.unpack_columns))
+        setattr(cls, "unpack_array", classmethod(columnar.unpack_array))
+        setattr(cls, "wrap", classmethod(columnar.wrap))
 
         return cls
 
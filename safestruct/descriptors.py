@@ -2,10 +2,15 @@ from typing import Callable, Any, Type
 from .exceptions import FormatError, PackingError
 
 
+def _accept_all(value: Any) -> bool:
+    """Default ``check``: accepts every value."""
+    return True
+
+
 class FieldDescriptor:
-    def __init__(
-        self, struct_char: str, *, check: Callable[[Any], bool] = lambda x: True
-    ):
+    __slots__ = ("_struct_char", "_validator", "default")
+
+    def __init__(self, struct_char: str, *, check: Callable[[Any], bool] = _accept_all):
         self._struct_char = struct_char
         self._validator = check
         self.default = self
@@ -16,6 +21,10 @@ class FieldDescriptor:
     def get_validator(self) -> Callable:
         return self._validator
 
+    def has_custom_check(self) -> bool:
+        """Whether a user-supplied ``check`` was given for this field."""
+        return self._validator is not _accept_all
+
 
 _INTEGER_LIMITS = {
     # Signed
@@ -37,9 +46,9 @@ _INTEGER_LIMITS = {
 
 
 class IntField(FieldDescriptor):
-    def __init__(
-        self, struct_char: str, *, check: Callable[[int], bool] = lambda x: True
-    ):
+    __slots__ = ("_min_val", "_max_val")
+
+    def __init__(self, struct_char: str, *, check: Callable[[int], bool] = _accept_all):
         base_char = struct_char.lstrip("@=<>!")
         if base_char not in _INTEGER_LIMITS:
             raise FormatError(
@@ -51,13 +60,22 @@ class IntField(FieldDescriptor):
         self._min_val, self._max_val = _INTEGER_LIMITS[base_char]
 
     def get_validator(self) -> Callable:
+        min_val, max_val = self._min_val, self._max_val
+
+        if not self.has_custom_check():
+
+            def range_check(value: int) -> bool:
+                return isinstance(value, int) and min_val <= value <= max_val
+
+            return range_check
+
         base_validator = super().get_validator()
 
         def combined_check(value: int) -> bool:
             if not isinstance(value, int):
                 return False
 
-            if not (self._min_val <= value <= self._max_val):
+            if not (min_val <= value <= max_val):
                 return False
 
             return base_validator(value)
@@ -66,8 +84,10 @@ class IntField(FieldDescriptor):
 
 
 class BooleanField(FieldDescriptor):
+    __slots__ = ()
+
     def __init__(
-        self, struct_char: str = "?", *, check: Callable[[bool], bool] = lambda x: True
+        self, struct_char: str = "?", *, check: Callable[[bool], bool] = _accept_all
     ):
         if struct_char != "?":
             raise FormatError(
@@ -92,7 +112,9 @@ class BytesField(FieldDescriptor):
     A descriptor for fixed-length bytes/string types ('Ns' format).
     """
 
-    def __init__(self, length: int, *, check: Callable[[bytes], bool] = lambda x: True):
+    __slots__ = ("_length",)
+
+    def __init__(self, length: int, *, check: Callable[[bytes], bool] = _accept_all):
         if not isinstance(length, int) or length <= 0:
             raise FormatError("BytesField requires a positive integer 'length'.")
 
@@ -101,13 +123,22 @@ class BytesField(FieldDescriptor):
         self._length = length
 
     def get_validator(self) -> Callable:
+        length = self._length
+
+        if not self.has_custom_check():
+
+            def length_check(value: bytes) -> bool:
+                return isinstance(value, (bytes, bytearray)) and len(value) == length
+
+            return length_check
+
         base_validator = super().get_validator()
 
         def combined_check(value: bytes) -> bool:
             if not isinstance(value, (bytes, bytearray)):
                 return False
 
-            if len(value) != self._length:
+            if len(value) != length:
                 return False
 
             return base_validator(value)
@@ -130,6 +161,8 @@ class SubStructField(FieldDescriptor):
     A descriptor for nesting one SafeStruct inside another.
     """
 
+    __slots__ = ("_struct_class",)
+
     def __init__(self, struct_class: Type):
         if not hasattr(struct_class, "_safestruct_format"):
             raise FormatError(
@@ -154,12 +187,14 @@ class TextField(FieldDescriptor):
     Handles encoding, null-byte padding, and stripping.
     """
 
+    __slots__ = ("_length", "_encoding")
+
     def __init__(
         self,
         length: int,
         encoding: str = "utf-8",
         *,
-        check: Callable[[str], bool] = lambda x: True,
+        check: Callable[[str], bool] = _accept_all,
     ):
         if not isinstance(length, int) or length <= 0:
             raise FormatError("TextField requires a positive integer 'length'.")
@@ -209,6 +244,8 @@ class ArrayField(FieldDescriptor):
     A descriptor for fixed-length arrays of primitive types (e.g., '4I').
     """
 
+    __slots__ = ("_count", "_item_descriptor")
+
     def __init__(self, item_descriptor: FieldDescriptor, count: int):
         if not isinstance(count, int) or count <= 0:
             raise FormatError("ArrayField requires a positive integer 'count'.")
@@ -229,24 +266,56 @@ class ArrayField(FieldDescriptor):
 
         struct_char = f"{count}{item_char}"
 
-        super().__init__(struct_char, check=lambda x: True)
+        super().__init__(struct_char, check=_accept_all)
 
     def get_validator(self) -> Callable:
+        count = self._count
+        item_descriptor = self._item_descriptor
+
+        if (
+            type(item_descriptor).get_validator is IntField.get_validator
+            and not item_descriptor.has_custom_check()
+        ):
+            min_val, max_val = item_descriptor._min_val, item_descriptor._max_val
+
+            def int_array_check(value: list) -> bool:
+                if not isinstance(value, list) or len(value) != count:
+                    return False
+
+                for item in value:
+                    if not isinstance(item, int) or item < min_val or item > max_val:
+                        return False
+
+                return True
+
+            return int_array_check
+
+        item_validator = item_descriptor.get_validator()
+
         def combined_check(value: list) -> bool:
-            if not isinstance(value, list) or len(value) != self._count:
+            if not isinstance(value, list) or len(value) != count:
                 return False
 
-            item_validator = self._item_descriptor.get_validator()
-            return all(item_validator(item) for item in value)
+            for item in value:
+                if not item_validator(item):
+                    return False
+
+            return True
 
         return combined_check
 
     def pack_value(self, value: list) -> list:
-        """Flattens the list for struct.pack."""
+        """
+        Flattens the list for struct.pack. The generated pack methods splice the
+        items in directly unless a subclass overrides this method.
+        """
         return value
 
     def unpack_value(self, values: tuple) -> list:
-        """Reassembles the tuple slice back into a list."""
+        """
+        Reassembles the tuple slice back into a list. The generated unpack methods
+        build the list literal directly unless a subclass overrides this method.
+        """
         return list(values)
 
     def get_primitive_count(self):
@@ -258,8 +327,10 @@ class FloatField(FieldDescriptor):
     A descriptor for standard C-floating point types (f, d).
     """
 
+    __slots__ = ()
+
     def __init__(
-        self, struct_char: str, *, check: Callable[[float], bool] = lambda x: True
+        self, struct_char: str, *, check: Callable[[float], bool] = _accept_all
     ):
         base_char = struct_char.lstrip("@=<>!")
 
@@ -269,6 +340,13 @@ class FloatField(FieldDescriptor):
         super().__init__(struct_char, check=check)
 
     def get_validator(self) -> Callable:
+        if not self.has_custom_check():
+
+            def float_check(value: float) -> bool:
+                return isinstance(value, float)
+
+            return float_check
+
         base_validator = super().get_validator()
 
         def combined_check(value: float) -> bool:
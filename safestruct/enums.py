@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class ByteOrder(Enum):
@@ -19,3 +19,20 @@ class ByteOrder(Enum):
 
     def to_struct_char(self) -> str:
         return self.value
+
+
+class FieldKind(IntEnum):
+    """
+    How a field maps onto the flat value tuple of the compiled struct.
+    Resolved once at decoration time so the generated methods never need
+    isinstance checks.
+    PRIMITIVE  single value passed to struct unchanged
+    ARRAY      fixed count of values spliced from a list
+    SUBSTRUCT  nested SafeStruct whose fields are inlined
+    ENCODED    single value converted by pack_value/unpack_value (bytes, text)
+    """
+
+    PRIMITIVE = 0
+    ARRAY = 1
+    SUBSTRUCT = 2
+    ENCODED = 3
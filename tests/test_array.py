@@ -1,9 +1,10 @@
 import unittest
 import struct as stdlib_struct
+from dataclasses import dataclass
 
-from safestruct import ValidationError, FormatError
+from safestruct import ValidationError, FormatError, ByteOrder, struct
 from safestruct import SubStructField
-from safestruct.descriptors import TextField, ArrayField
+from safestruct.descriptors import TextField, ArrayField, IntField, BooleanField
 from tests.defs import SensorData, Header
 
 
@@ -45,6 +46,80 @@ class TestArrayField(unittest.TestCase):
         ):
             data_bad_type.pack()
 
+    def test_array_field_subclass_pack_value_is_used(self):
+        class ReversedArray(ArrayField):
+            def pack_value(self, value):
+                return value[::-1]
+
+        @struct(order=ByteOrder.LITTLE)
+        @dataclass
+        class Reversed:
+            values: list[int] = ReversedArray(IntField("B"), count=3)
+
+        record = Reversed(values=[1, 2, 3])
+
+        self.assertEqual(record.pack(), b"\x03\x02\x01")
+        self.assertEqual(Reversed.pack_many([record]), b"\x03\x02\x01")
+
+    def test_array_field_subclass_unpack_value_is_used(self):
+        class TupleArray(ArrayField):
+            def unpack_value(self, values):
+                return tuple(values)
+
+        @struct(order=ByteOrder.LITTLE)
+        @dataclass
+        class Tupled:
+            flag: bool = BooleanField()
+            values: list[int] = TupleArray(IntField("B"), count=3)
+
+        raw = b"\x01\x01\x02\x03"
+
+        self.assertEqual(Tupled.unpack(raw).values, (1, 2, 3))
+        self.assertEqual(Tupled.unpack_field(raw, "values"), (1, 2, 3))
+
+    def test_array_field_packing_item_range_and_check(self):
+        @struct(order=ByteOrder.LITTLE)
+        @dataclass
+        class EvenBytes:
+            values: list[int] = ArrayField(
+                IntField("B", check=lambda x: x % 2 == 0), count=2
+            )
+
+        self.assertEqual(EvenBytes(values=[2, 4]).pack(), b"\x02\x04")
+
+        for bad_values in ([2, 3], [2, 256]):
+            with self.assertRaisesRegex(
+                ValidationError, "Validation failed for field 'values'"
+            ):
+                EvenBytes(values=bad_values).pack()
+
+    def test_boolean_array_field_rejects_non_bool_items(self):
+        @struct(order=ByteOrder.LITTLE)
+        @dataclass
+        class Flags:
+            bits: list[bool] = ArrayField(BooleanField(), count=2)
+
+        self.assertEqual(Flags(bits=[True, False]).pack(), b"\x01\x00")
+
+        with self.assertRaisesRegex(
+            ValidationError, "Validation failed for field 'bits'"
+        ):
+            Flags(bits=[True, 1]).pack()
+
+    def test_array_field_validator_uses_overridden_item_validator(self):
+        class EvenInt(IntField):
+            def get_validator(self):
+                return lambda value: value % 2 == 0
+
+        @struct(order=ByteOrder.LITTLE)
+        @dataclass
+        class EvenPair:
+            values: list[int] = ArrayField(EvenInt("B"), count=2)
+
+        validator = EvenPair._safestruct_field_map["values"]["validator"]
+        self.assertTrue(validator([2, 4]))
+        self.assertFalse(validator([1, 3]))
+
     def test_array_field_format_validation(self):
         with self.assertRaisesRegex(
             FormatError, "currently only supports IntField or BooleanField primitives"
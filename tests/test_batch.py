@@ -0,0 +1,72 @@
+import unittest
+import struct as stdlib_struct
+
+from safestruct import ValidationError, UnpackingError
+from tests.defs import SensorData, SubStructMessage, Header, UserRecord
+
+
+class TestBatchMethods(unittest.TestCase):
+    def test_pack_many(self):
+        records = [
+            SensorData(timestamp=i, readings=[i, i + 1, i + 2, i + 3], checksum=0xF000)
+            for i in range(3)
+        ]
+
+        packed = SensorData.pack_many(records)
+
+        self.assertIsInstance(packed, bytes)
+        self.assertEqual(len(packed), 3 * SensorData._safestruct_size)
+        self.assertEqual(packed, b"".join(record.pack() for record in records))
+
+    def test_pack_many_empty(self):
+        self.assertEqual(SensorData.pack_many([]), b"")
+
+    def test_pack_many_validation_error(self):
+        records = [
+            Header(version=1, length=2, status=3),
+            Header(version=1, length=2, status=-5),
+        ]
+
+        with self.assertRaisesRegex(
+            ValidationError, "Validation failed for field 'status' in Header"
+        ):
+            Header.pack_many(records)
+
+    def test_unpack_many(self):
+        raw_data = stdlib_struct.pack("<BHbL", 1, 2, 3, 4) + stdlib_struct.pack(
+            "<BHbL", 5, 6, 7, 8
+        )
+
+        messages = SubStructMessage.unpack_many(raw_data)
+
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(messages[0].header, Header(version=1, length=2, status=3))
+        self.assertEqual(messages[1].header, Header(version=5, length=6, status=7))
+        self.assertEqual(messages[1].payload_id, 8)
+
+    def test_unpack_many_round_trip(self):
+        records = [
+            UserRecord(user_id=1, username="alice", is_admin=True),
+            UserRecord(user_id=2, username="bob", is_admin=False),
+        ]
+
+        self.assertEqual(UserRecord.unpack_many(UserRecord.pack_many(records)), records)
+
+    def test_unpack_many_partial_record(self):
+        with self.assertRaisesRegex(UnpackingError, "Unpacking many failed for Header"):
+            Header.unpack_many(b"\x01\x02\x03\x04\x05")
+
+    def test_iter_unpack(self):
+        records = [Header(version=i, length=i * 10, status=0) for i in range(3)]
+
+        iterator = Header.iter_unpack(Header.pack_many(records))
+
+        self.assertNotIsInstance(iterator, list)
+        self.assertEqual(next(iterator), records[0])
+        self.assertEqual(list(iterator), records[1:])
+
+    def test_iter_unpack_partial_record(self):
+        with self.assertRaisesRegex(
+            UnpackingError, "Iterative unpacking failed for Header"
+        ):
+            Header.iter_unpack(b"\x01\x02\x03\x04\x05")
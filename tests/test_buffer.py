@@ -1,14 +1,16 @@
 import unittest
+from dataclasses import dataclass
 
-from safestruct import ValidationError, UnpackingError
-from tests.defs import Header
+from safestruct import ValidationError, PackingError, UnpackingError
+from safestruct import ByteOrder, IntField, struct
+from tests.defs import Header, Message, SensorData
 
 
 class TestBufferMethods(unittest.TestCase):
     def test_pack_into_with_offset(self):
         """Tests packing into a bytearray with an offset."""
         header_instance = Header(version=1, length=256, status=5)
-        buffer = bytearray(b"\xAA" * 10)
+        buffer = bytearray(b"\xaa" * 10)
         expected_header_bytes = b"\x01\x01\x00\x05"
 
         offset = 3
@@ -18,17 +20,17 @@ class TestBufferMethods(unittest.TestCase):
             buffer[offset : offset + Header._safestruct_size], expected_header_bytes
         )
 
-        self.assertEqual(buffer[:offset], b"\xAA" * offset)
+        self.assertEqual(buffer[:offset], b"\xaa" * offset)
         self.assertEqual(
             buffer[offset + Header._safestruct_size :],
-            b"\xAA" * (10 - offset - Header._safestruct_size),
+            b"\xaa" * (10 - offset - Header._safestruct_size),
         )
 
     def test_unpack_from_with_offset(self):
         """Tests unpacking a struct starting from an offset in a bytes object."""
 
         raw_header_data = b"\x01\x02\x00\x03"
-        buffer = b"\xCC\xCC" + raw_header_data + b"\xDD\xDD\xDD\xDD"
+        buffer = b"\xcc\xcc" + raw_header_data + b"\xdd\xdd\xdd\xdd"
 
         offset = 2
 
@@ -51,11 +53,113 @@ class TestBufferMethods(unittest.TestCase):
 
     def test_unpack_from_insufficient_buffer_size(self):
         """Tests that size check fires for unpack_from."""
-        small_buffer = b"\xAA\xBB\xCC"
+        small_buffer = b"\xaa\xbb\xcc"
 
         with self.assertRaisesRegex(UnpackingError, "Unpack buffer too small"):
             Header.unpack_from(small_buffer, offset=0)
 
-        buffer_4 = b"\xAA\xBB\xCC\xDD"
+        buffer_4 = b"\xaa\xbb\xcc\xdd"
         with self.assertRaisesRegex(UnpackingError, "Unpack buffer too small"):
             Header.unpack_from(buffer_4, offset=1)
+
+    def test_unpack_field(self):
+        """Tests decoding single fields straight from a packed buffer."""
+        message = Message(
+            header=Header(version=1, length=2, status=3),
+            payload_id=7,
+            user_id=9,
+            username="alice",
+            is_admin=True,
+        )
+        buffer = b"\xaa\xaa" + message.pack()
+
+        self.assertEqual(Message._safestruct_field_offsets["username"], 12)
+        self.assertEqual(Message.unpack_field(buffer, "user_id", offset=2), 9)
+        self.assertEqual(Message.unpack_field(buffer, "username", offset=2), "alice")
+        self.assertEqual(
+            Message.unpack_field(buffer, "header", offset=2),
+            Header(version=1, length=2, status=3),
+        )
+
+        sensor = SensorData(timestamp=1, readings=[1, 2, 3, 4], checksum=0xEF00)
+        self.assertEqual(
+            SensorData.unpack_field(sensor.pack(), "readings"), [1, 2, 3, 4]
+        )
+
+    def test_field_helpers_are_built_on_first_use(self):
+        """Tests that per-field decoders and encoders are generated lazily."""
+
+        @struct(order=ByteOrder.NETWORK)
+        @dataclass
+        class Lazy:
+            a: int = IntField("B")
+            b: int = IntField("H")
+
+        self.assertEqual(Lazy._safestruct_field_unpackers, {})
+        self.assertEqual(Lazy._safestruct_field_packers, {})
+
+        buffer = Lazy(a=1, b=2).pack()
+        self.assertEqual(Lazy.unpack_field(buffer, "b"), 2)
+        unpacker = Lazy._safestruct_field_unpackers["b"]
+
+        self.assertEqual(Lazy.unpack_field(buffer, "b"), 2)
+        self.assertIs(Lazy._safestruct_field_unpackers["b"], unpacker)
+        self.assertNotIn("a", Lazy._safestruct_field_unpackers)
+
+        buffer = bytearray(buffer)
+        Lazy.pack_field_into(buffer, "b", 3)
+        self.assertEqual(Lazy.unpack_field(buffer, "b"), 3)
+        self.assertEqual(list(Lazy._safestruct_field_packers), ["b"])
+
+    def test_unpack_field_errors(self):
+        """Tests that unknown fields and short buffers raise UnpackingError."""
+        with self.assertRaisesRegex(
+            UnpackingError, "'missing' is not a field of Header"
+        ):
+            Header.unpack_field(b"\x00" * 4, "missing")
+
+        with self.assertRaisesRegex(
+            UnpackingError, "Unpacking field 'status' failed for Header"
+        ):
+            Header.unpack_field(b"\x00" * 3, "status")
+
+    def test_pack_field_into(self):
+        """Tests updating single fields of an already packed buffer in place."""
+        message = Message(
+            header=Header(version=1, length=2, status=3),
+            payload_id=7,
+            user_id=9,
+            username="alice",
+            is_admin=True,
+        )
+        buffer = bytearray(b"\xaa\xaa") + message.pack()
+
+        Message.pack_field_into(buffer, "user_id", 42, offset=2)
+        Message.pack_field_into(buffer, "username", "bob", offset=2)
+        Message.pack_field_into(
+            buffer, "header", Header(version=4, length=5, status=6), offset=2
+        )
+
+        updated = Message.unpack_from(buffer, offset=2)
+        self.assertEqual(updated.user_id, 42)
+        self.assertEqual(updated.username, "bob")
+        self.assertEqual(updated.header, Header(version=4, length=5, status=6))
+        self.assertEqual(updated.payload_id, 7)
+        self.assertEqual(buffer[:2], b"\xaa\xaa")
+
+    def test_pack_field_into_errors(self):
+        """Tests that invalid values, unknown fields and short buffers are rejected."""
+        buffer = bytearray(Header(version=1, length=2, status=3).pack())
+
+        with self.assertRaisesRegex(
+            ValidationError, "Validation failed for field 'status' in Header"
+        ):
+            Header.pack_field_into(buffer, "status", -5)
+
+        with self.assertRaisesRegex(PackingError, "'missing' is not a field of Header"):
+            Header.pack_field_into(buffer, "missing", 1)
+
+        with self.assertRaisesRegex(
+            PackingError, "Packing field 'status' failed for Header"
+        ):
+            Header.pack_field_into(bytearray(3), "status", 1)
@@ -0,0 +1,105 @@
+import unittest
+import struct as stdlib_struct
+from dataclasses import dataclass
+
+from safestruct import ByteOrder, IntField, SubStructField, UnpackingError, struct
+from safestruct.columnar import numpy_dtype
+from tests.defs import (
+    SensorData,
+    Message,
+    Header,
+    TelemetryPacket,
+    UserRecord,
+    ProtocolMessage,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestColumnarUnpacking(unittest.TestCase):
+    def test_numpy_dtype_matches_layout(self):
+        dtype = numpy_dtype(SensorData)
+
+        self.assertEqual(dtype.itemsize, SensorData._safestruct_size)
+        self.assertEqual(dtype["timestamp"], numpy.dtype(">u8"))
+        self.assertEqual(dtype["readings"].shape, (4,))
+
+    def test_unpack_columns(self):
+        raw_data = b"".join(
+            stdlib_struct.pack(">QIIIIH", i, i, i + 1, i + 2, i + 3, 0xEF00 + i)
+            for i in range(3)
+        )
+
+        columns = SensorData.unpack_columns(raw_data)
+
+        self.assertEqual(list(columns), ["timestamp", "readings", "checksum"])
+        self.assertEqual(columns["timestamp"].tolist(), [0, 1, 2])
+        self.assertEqual(columns["readings"].shape, (3, 4))
+        self.assertEqual(columns["readings"][2].tolist(), [2, 3, 4, 5])
+        self.assertEqual(columns["checksum"].tolist(), [0xEF00, 0xEF01, 0xEF02])
+
+    def test_unpack_columns_nested_text_and_float(self):
+        messages = [
+            Message(Header(1, 2, 3), 4, 5, "alice", True),
+            Message(Header(6, 7, 8), 9, 10, "bob", False),
+        ]
+
+        columns = Message.unpack_columns(Message.pack_many(messages))
+
+        self.assertEqual(columns["header"]["length"].tolist(), [2, 7])
+        self.assertEqual(columns["username"].tolist(), ["alice", "bob"])
+        self.assertEqual(columns["is_admin"].tolist(), [True, False])
+
+        packet = TelemetryPacket(
+            timestamp=1, temperature=0.5, pressure=2.25, is_valid=True
+        )
+        columns = TelemetryPacket.unpack_columns(packet.pack())
+        self.assertEqual(columns["pressure"].tolist(), [2.25])
+
+    def test_unpack_columns_nested_text_and_raw_bytes(self):
+        @struct(order=ByteOrder.NETWORK)
+        @dataclass
+        class Envelope:
+            user: UserRecord = SubStructField(UserRecord)
+            tag: int = IntField("B")
+
+        envelope = Envelope(UserRecord(1, "alice", True), 7)
+        columns = Envelope.unpack_columns(envelope.pack())
+        self.assertEqual(columns["user"]["username"].tolist(), ["alice"])
+        self.assertEqual(columns["user"]["user_id"].tolist(), [1])
+
+        message = ProtocolMessage(magic=1, id=b"\x01\x00\x00\x00", reserved=b"\x00")
+        columns = ProtocolMessage.unpack_columns(message.pack())
+        self.assertEqual(columns["id"].tolist(), [b"\x01\x00\x00\x00"])
+        self.assertEqual(columns["reserved"].tolist(), [b"\x00"])
+
+    def test_unpack_columns_partial_record(self):
+        with self.assertRaisesRegex(
+            UnpackingError, "Columnar unpacking failed for Header"
+        ):
+            Header.unpack_columns(b"\x01\x02\x03\x04\x05")
+
+    def test_unpack_array_and_wrap(self):
+        records = [
+            SensorData(timestamp=i, readings=[i, i + 1, i + 2, i + 3], checksum=0xF000)
+            for i in range(3)
+        ]
+
+        array = SensorData.unpack_array(SensorData.pack_many(records))
+
+        self.assertEqual(array.dtype, numpy_dtype(SensorData))
+        self.assertEqual(array["timestamp"].tolist(), [0, 1, 2])
+        self.assertEqual(SensorData.wrap(array, 1), records[1])
+
+        with self.assertRaisesRegex(UnpackingError, "Cannot wrap record for Header"):
+            Header.wrap(array, 0)
+
+    def test_unpack_array_partial_record(self):
+        with self.assertRaisesRegex(
+            UnpackingError, "Array unpacking failed for Header"
+        ):
+            Header.unpack_array(b"\x01\x02\x03\x04\x05")
@@ -1,12 +1,14 @@
+import copy
 import unittest
 import struct as stdlib_struct
-from dataclasses import dataclass
+from dataclasses import dataclass, field, make_dataclass
 
 from safestruct import struct
 from safestruct import ValidationError, UnpackingError
 from safestruct import IntField, BooleanField
-from safestruct.enums import ByteOrder
-from tests.defs import UserRecord, Header, Packet, SensorData
+from safestruct.descriptors import ArrayField, BytesField, FloatField, TextField
+from safestruct.enums import ByteOrder, FieldKind
+from tests.defs import UserRecord, Header, Packet, SensorData, Message
 
 
 class TestSafeStructCore(unittest.TestCase):
@@ -20,12 +22,41 @@ class TestSafeStructCore(unittest.TestCase):
         self.assertEqual(SensorData._safestruct_format, ">Q4IH")
         self.assertEqual(SensorData._safestruct_size, 26)
 
+    def test_compiled_struct_matches_format(self):
+        self.assertIsInstance(Header._safestruct_compiled, stdlib_struct.Struct)
+        self.assertEqual(Header._safestruct_compiled.format, "!BHb")
+        self.assertEqual(SensorData._safestruct_compiled.size, 26)
+
+    def test_compiled_struct_shared_across_classes(self):
+        @struct(order=ByteOrder.NETWORK)
+        @dataclass
+        class SameLayout:
+            a: int = IntField("B")
+            b: int = IntField("H")
+            c: int = IntField("b")
+
+        self.assertIs(SameLayout._safestruct_compiled, Header._safestruct_compiled)
+
     def test_field_map_generation(self):
         self.assertIn("status", Header._safestruct_field_map)
         status_validator = Header._safestruct_field_map["status"]["validator"]
         self.assertTrue(status_validator(0))
         self.assertFalse(status_validator(-5))
 
+    def test_field_plan_generation(self):
+        plan = {entry.name: entry for entry in Message._safestruct_plan}
+
+        self.assertEqual(
+            [entry.name for entry in Message._safestruct_plan],
+            list(Message._safestruct_field_map),
+        )
+        self.assertEqual(plan["header"].kind, FieldKind.SUBSTRUCT)
+        self.assertIs(plan["header"].struct_class, Header)
+        self.assertEqual(plan["username"].kind, FieldKind.ENCODED)
+        self.assertEqual(plan["is_admin"].kind, FieldKind.PRIMITIVE)
+        self.assertEqual(SensorData._safestruct_plan[1].kind, FieldKind.ARRAY)
+        self.assertEqual(SensorData._safestruct_plan[1].num_primitives, 4)
+
     def test_non_descriptor_field_raises_error(self):
         with self.assertRaisesRegex(TypeError, "must use a SafeStruct FieldDescriptor"):
 
@@ -46,6 +77,61 @@ class TestSafeStructCore(unittest.TestCase):
         with self.assertRaisesRegex(ValidationError, "Validation failed"):
             instance.pack()
 
+    def test_subclass_validators_are_not_inlined(self):
+        def overriding(field_type, predicate):
+            return type(
+                f"Custom{field_type.__name__}",
+                (field_type,),
+                {"get_validator": lambda self: predicate},
+            )
+
+        def even(value):
+            return value % 2 == 0
+
+        def is_true(value):
+            return value is True
+
+        cases = (
+            ("int", overriding(IntField, even)("B"), 2, 3),
+            ("bool", overriding(BooleanField, is_true)(), True, False),
+            ("float", overriding(FloatField, lambda v: v >= 0.0)("d"), 1.5, -1.5),
+            ("bytes", overriding(BytesField, bytes.isascii)(length=2), b"ab", b"\xffb"),
+            ("text", overriding(TextField, str.islower)(length=4), "ab", "AB"),
+            (
+                "int items",
+                ArrayField(overriding(IntField, even)("B"), 2),
+                [2, 4],
+                [2, 3],
+            ),
+            (
+                "bool items",
+                ArrayField(overriding(BooleanField, is_true)(), 2),
+                [True, True],
+                [True, False],
+            ),
+            (
+                "array",
+                overriding(ArrayField, lambda v: v == sorted(v))(IntField("B"), 2),
+                [1, 2],
+                [2, 1],
+            ),
+        )
+
+        for name, descriptor, good, bad in cases:
+            with self.subTest(name):
+                Record = struct(order=ByteOrder.LITTLE)(
+                    make_dataclass(
+                        "Record", [("value", object, field(default=descriptor))]
+                    )
+                )
+
+                self.assertEqual(Record.unpack(Record(value=good).pack()).value, good)
+
+                with self.assertRaisesRegex(
+                    ValidationError, "Validation failed for field 'value' in Record"
+                ):
+                    Record(value=bad).pack()
+
     def test_basic_packing(self):
         header = Header(version=5, length=1024, status=1)
         packed_bytes = header.pack()
@@ -60,6 +146,39 @@ class TestSafeStructCore(unittest.TestCase):
         ):
             bad_header.pack()
 
+    def test_validate_without_packing(self):
+        self.assertIsNone(Header(version=5, length=1024, status=1)._validate())
+
+        with self.assertRaisesRegex(
+            ValidationError, "Validation failed for field 'status' in Header"
+        ):
+            Header(version=5, length=1024, status=-5)._validate()
+
+    def test_user_defined_validate_is_kept(self):
+        @struct(order=ByteOrder.NETWORK)
+        @dataclass
+        class OwnValidate:
+            value: int = IntField("B")
+
+            def validate(self):
+                return "user"
+
+        self.assertEqual(OwnValidate(value=1).validate(), "user")
+
+    def test_class_names_are_not_evaluated_in_generated_code(self):
+        for name in ("Bad{x}", 'Q"uote'):
+            cls = struct(order=ByteOrder.LITTLE)(
+                make_dataclass(name, [("x", int, field(default=IntField("B")))])
+            )
+
+            with self.assertRaises(ValidationError) as context:
+                cls(x=300).pack()
+            self.assertIn(f"in {name}. Value: 300", str(context.exception))
+
+            with self.assertRaises(UnpackingError) as context:
+                cls.unpack(b"\x01\x02")
+            self.assertIn(f"failed for {name} (Format: <B)", str(context.exception))
+
     def test_packing_low_level_error(self):
         @struct(order=ByteOrder.NETWORK)
         @dataclass
@@ -71,6 +190,63 @@ class TestSafeStructCore(unittest.TestCase):
         ):
             LowLevelTest(value=300).pack()
 
+    def test_slots_option(self):
+        @struct(order=ByteOrder.NETWORK, slots=True)
+        @dataclass
+        class SlottedHeader:
+            version: int = IntField("B")
+            length: int = IntField("H")
+
+        header = SlottedHeader(version=1, length=2)
+
+        self.assertTrue(SlottedHeader._safestruct_slots)
+        self.assertEqual(SlottedHeader.__slots__, ("version", "length"))
+        self.assertFalse(hasattr(header, "__dict__"))
+        self.assertEqual(SlottedHeader.unpack(header.pack()), header)
+
+        with self.assertRaises(AttributeError):
+            header.extra = 1
+
+    def test_slots_option_with_string_slots_base(self):
+        class Base:
+            __slots__ = "ab"
+
+        @struct(order=ByteOrder.NETWORK, slots=True)
+        @dataclass
+        class Child(Base):
+            a: int = IntField("B")
+            b: int = IntField("B")
+
+        self.assertEqual(Child.__slots__, ("a", "b"))
+        self.assertEqual(Child(a=1, b=2).pack(), b"\x01\x02")
+
+    def test_slots_option_rejects_existing_slots(self):
+        with self.assertRaisesRegex(TypeError, "already specifies __slots__"):
+
+            @struct(order=ByteOrder.NETWORK, slots=True)
+            @dataclass(slots=True)
+            class AlreadySlotted:
+                value: int = IntField("B")
+
+    def test_slots_option_keeps_zero_argument_super(self):
+        @struct(order=ByteOrder.NETWORK, slots=True)
+        @dataclass
+        class Named:
+            value: int = IntField("B")
+
+            def __repr__(self):
+                return "Named:" + super().__repr__()
+
+        self.assertTrue(repr(Named(value=1)).startswith("Named:<"))
+
+    def test_slots_option_frozen_instances_can_be_copied(self):
+        @struct(order=ByteOrder.NETWORK, slots=True)
+        @dataclass(frozen=True)
+        class Frozen:
+            value: int = IntField("B")
+
+        self.assertEqual(copy.deepcopy(Frozen(value=7)), Frozen(value=7))
+
     def test_basic_unpacking(self):
         raw_bytes = stdlib_struct.pack("<?I", True, 0xDEADBEEF)
 
@@ -1,5 +1,8 @@
 import unittest
 import struct as std_struct
+from dataclasses import dataclass
+
+from safestruct import struct, ByteOrder
 from safestruct.core import ValidationError, FormatError
 from safestruct.descriptors import FloatField
 from tests.defs import TelemetryPacket
@@ -63,3 +66,18 @@ class TestFloatField(unittest.TestCase):
             ValidationError, "Validation failed for field 'temperature'"
         ):
             packet_bad.pack()
+
+    def test_float_field_custom_check(self):
+        """Tests that a custom check runs after the float type check."""
+
+        @struct(order=ByteOrder.LITTLE)
+        @dataclass
+        class Reading:
+            value: float = FloatField("f", check=lambda x: x >= 0.0)
+
+        self.assertEqual(len(Reading(value=1.5).pack()), 4)
+
+        with self.assertRaisesRegex(
+            ValidationError, "Validation failed for field 'value' in Reading"
+        ):
+            Reading(value=-1.5).pack()
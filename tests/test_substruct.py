@@ -2,9 +2,9 @@ import unittest
 import struct as stdlib_struct
 from dataclasses import dataclass
 
-from safestruct import FormatError
-from safestruct import SubStructField
-from tests.defs import SubStructMessage, Header
+from safestruct import FormatError, ValidationError
+from safestruct import struct, ByteOrder, IntField, SubStructField
+from tests.defs import SubStructMessage, Header, UserRecord, SensorData
 
 
 class TestSubStructField(unittest.TestCase):
@@ -23,6 +23,16 @@ class TestSubStructField(unittest.TestCase):
         expected_data = stdlib_struct.pack("<BHbL", 1, 1024, 1, 0xDEADBEEF)
         self.assertEqual(packed_data, expected_data)
 
+    def test_substruct_packing_validates_nested_fields(self):
+        message_instance = SubStructMessage(
+            header=Header(version=1, length=1024, status=-5), payload_id=1
+        )
+
+        with self.assertRaisesRegex(
+            ValidationError, "Validation failed for field 'status' in Header"
+        ):
+            message_instance.pack()
+
     def test_substruct_unpacking(self):
         raw_data = stdlib_struct.pack("<BHbL", 5, 2048, 1, 0xCAFEF00D)
 
@@ -35,6 +45,25 @@ class TestSubStructField(unittest.TestCase):
         self.assertEqual(message.header.status, 1)
         self.assertEqual(message.payload_id, 0xCAFEF00D)
 
+    def test_substruct_with_text_and_array_round_trip(self):
+        @struct(order=ByteOrder.BIG)
+        @dataclass
+        class Envelope:
+            user: UserRecord = SubStructField(UserRecord)
+            sensor: SensorData = SubStructField(SensorData)
+            tail: int = IntField("B")
+
+        envelope = Envelope(
+            user=UserRecord(user_id=7, username="alice", is_admin=True),
+            sensor=SensorData(timestamp=1, readings=[1, 2, 3, 4], checksum=0xEF01),
+            tail=9,
+        )
+
+        self.assertEqual(Envelope.unpack(envelope.pack()), envelope)
+        self.assertEqual(
+            Envelope.unpack_field(envelope.pack(), "sensor"), envelope.sensor
+        )
+
     def test_substruct_raises_on_non_safestruct_class(self):
         @dataclass
         class UnsafeHeader:
@@ -1,7 +1,9 @@
 import unittest
 import struct as stdlib_struct
+from dataclasses import dataclass
 
-from safestruct import ValidationError
+from safestruct import ValidationError, PackingError, ByteOrder, struct
+from safestruct.descriptors import TextField
 from tests.defs import UserRecord
 
 
@@ -37,3 +39,18 @@ class TestSafeStructCore(unittest.TestCase):
             ValidationError, "Validation failed for field 'username'"
         ):
             user_too_long.pack()
+
+    def test_text_field_subclass_validator_keeps_length_check(self):
+        class AnyText(TextField):
+            def get_validator(self):
+                return lambda value: isinstance(value, str)
+
+        @struct(order=ByteOrder.LITTLE)
+        @dataclass
+        class Named:
+            name: str = AnyText(length=4)
+
+        self.assertEqual(Named(name="ab").pack(), b"ab\x00\x00")
+
+        with self.assertRaisesRegex(PackingError, "exceeds fixed size 4 bytes"):
+            Named(name="abcdefgh").pack()